@@ -72,12 +72,9 @@ gateway.sourceFiles = [
 ]
 # Gateway auth is token/password or identity (Tailscale) by config
 # TODO - validate TLS usage per deployment
-try:
-    gateway.controls.authenticatesSource = True
-    gateway.controls.authorizesSource = True
-    gateway.controls.validatesInput = True
-except Exception:
-    pass
+gateway.controls.authenticatesSource = True
+gateway.controls.authorizesSource = True
+gateway.controls.validatesInput = True
 
 channel_adapters = Process("Channel Adapters")
 channel_adapters.inBoundary = local_host
@@ -365,7 +362,7 @@ agent_media_to_channel = Dataflow(
 )
 
 # Track data traversals
-Data(
+conversation_context = Data(
     name="Conversation Context",
     classification=Classification.RESTRICTED,
     traverses=[